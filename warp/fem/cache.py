@@ -1,7 +1,8 @@
 import bisect
 import re
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import warp as wp
 
@@ -148,6 +149,28 @@ def get_integrand_kernel(
     return _kernel_cache[key]
 
 
+def preload_modules(modules: Iterable, device=None, max_workers: Optional[int] = None):
+    """Compiles and loads a batch of Warp modules, building distinct modules concurrently.
+
+    Args:
+        modules: the Warp modules to load
+        device: device to load the compiled modules on; if ``None``, all devices
+        max_workers: maximum number of compilation threads; defaults to the thread pool's choice
+    """
+
+    # Deduplicate while preserving order -- several dynamic kernels may share a module
+    modules = list(dict.fromkeys(modules))
+
+    if len(modules) <= 1:
+        for module in modules:
+            wp.load_module(module, device=device)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(lambda module: wp.load_module(module, device=device), modules):
+            pass
+
+
 def cached_arg_value(func: Callable):
     """Decorator to be applied to member methods assembling Arg structs, so that the result gets
     automatically cached for the lifetime of the parent object
@@ -583,7 +583,7 @@ def get_integrate_bilinear_kernel(
         domain_index_arg: domain.ElementIndexArg,
         test_arg: test.space_restriction.NodeArg,
         trial_partition_arg: trial.space_partition.PartitionArg,
-        trial_topology_arg: trial.space_partition.space_topology.TopologyArg,
+        trial_topology_arg: trial.space.topology.TopologyArg,
         fields: FieldStruct,
         values: ValueStruct,
         row_offsets: wp.array(dtype=int),
@@ -1059,7 +1059,7 @@ def _launch_integrate_kernel(
         offsets = test.space_restriction.partition_element_offsets()
 
         trial_partition_arg = trial.space_partition.partition_arg_value(device)
-        trial_topology_arg = trial.space_partition.space_topology.topo_arg_value(device)
+        trial_topology_arg = trial.space.topology.topo_arg_value(device)
         wp.launch(
             kernel=kernel,
             dim=(
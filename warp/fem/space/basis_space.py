@@ -228,21 +228,22 @@ class ShapeBasisSpace(BasisSpace):
         element_node_indices = self._topology.element_node_indices().numpy()
         element_triangles = self._shape.element_node_triangulation()
 
-        tri_indices = element_node_indices[:, element_triangles].reshape(-1, 3)
+        # element_node_indices is node-major; bring back to (cell, tri, vertex) order
+        tri_indices = element_node_indices[element_triangles].transpose(2, 0, 1).reshape(-1, 3)
         return tri_indices
 
     def _node_tets(self):
         element_node_indices = self._topology.element_node_indices().numpy()
         element_tets = self._shape.element_node_tets()
 
-        tet_indices = element_node_indices[:, element_tets].reshape(-1, 4)
+        tet_indices = element_node_indices[element_tets].transpose(2, 0, 1).reshape(-1, 4)
         return tet_indices
 
     def _node_hexes(self):
         element_node_indices = self._topology.element_node_indices().numpy()
         element_hexes = self._shape.element_node_hexes()
 
-        hex_indices = element_node_indices[:, element_hexes].reshape(-1, 8)
+        hex_indices = element_node_indices[element_hexes].transpose(2, 0, 1).reshape(-1, 8)
         return hex_indices
 
 
@@ -237,7 +237,7 @@ class NodePartition(SpacePartition):
                 inputs=[
                     self.geo_partition.geometry.side_arg_value(device),
                     self.geo_partition.side_arg_value(device),
-                    self.space_topology.topo_arg_value(device),
+                    trace_topology.topo_arg_value(device),
                     node_category.array,
                 ],
                 device=device,
@@ -249,7 +249,7 @@ class NodePartition(SpacePartition):
                 inputs=[
                     self.geo_partition.geometry.side_arg_value(device),
                     self.geo_partition.side_arg_value(device),
-                    self.space_topology.topo_arg_value(device),
+                    trace_topology.topo_arg_value(device),
                     node_category.array,
                 ],
                 device=device,
@@ -35,6 +35,10 @@ class SpaceTopology:
         self.dimension = geometry.dimension
         self.NODES_PER_ELEMENT = wp.constant(nodes_per_element)
         self.ElementArg = geometry.CellArg
+        self._element_node_indices_cache = {}
+        self._trace_topology = None
+        self._name_cache = None
+        self._hash_cache = None
 
     @property
     def geometry(self) -> Geometry:
@@ -45,8 +49,12 @@ class SpaceTopology:
         """Number of nodes in the interpolation basis"""
         raise NotImplementedError
 
+    @cache.cached_arg_value
     def topo_arg_value(self, device) -> "TopologyArg":
-        """Value of the topology argument structure to be passed to device functions"""
+        """Value of the topology argument structure to be passed to device functions.
+
+        The value is cached per device for the lifetime of the topology.
+        """
         return SpaceTopology.TopologyArg()
 
     @property
@@ -66,28 +74,51 @@ class SpaceTopology:
         """Global node index for a given node in a given element"""
         raise NotImplementedError
 
-    def element_node_indices(self, out: Optional[wp.array] = None) -> wp.array:
-        """Returns a temporary array containing the global index for each node of each element"""
+    def element_node_indices(self, out: Optional[wp.array] = None, device=None) -> wp.array:
+        """Returns an array containing the global index for each node of each element.
+
+        The array is laid out in node-major (structure-of-arrays) order, i.e. with shape
+        ``(NODES_PER_ELEMENT, cell_count)``, so that the indices of a given node slot over
+        all elements are contiguous in memory.
+
+        The result is a pure function of the topology, so unless `out` is provided it is
+        computed once per device and cached for the lifetime of the topology.
+        """
+
+        if out is not None:
+            device = out.device
+        else:
+            device = wp.get_device(device)
+            cached = self._element_node_indices_cache.get(device.ordinal)
+            if cached is not None:
+                return cached
 
         NODES_PER_ELEMENT = self.NODES_PER_ELEMENT
 
-        @cache.dynamic_kernel(suffix=self.name)
+        # Key the generated kernel on the concrete node index function rather than the
+        # topology name alone, so identical instantiations share a single cached module
+        # while distinct dynamic functions with colliding names never alias
+        fill_kernel_suffix = getattr(self.element_node_index, "key", self.name)
+
+        @cache.dynamic_kernel(
+            suffix=fill_kernel_suffix, kernel_options={"max_unroll": NODES_PER_ELEMENT, "fast_math": True}
+        )
         def fill_element_node_indices(
             geo_cell_arg: self.geometry.CellArg,
             topo_arg: self.TopologyArg,
-            element_node_indices: wp.array2d(dtype=int),
+            element_node_indices: wp.array2d(dtype=wp.int32),
         ):
-            element_index = wp.tid()
-            for n in range(NODES_PER_ELEMENT):
-                element_node_indices[element_index, n] = self.element_node_index(
-                    geo_cell_arg, topo_arg, element_index, n
-                )
+            # Node slot is the slowest-varying launch dimension, so that consecutive
+            # threads write consecutive entries of one node row (full cache lines)
+            n, element_index = wp.tid()
+            element_node_indices[n, element_index] = self.element_node_index(geo_cell_arg, topo_arg, element_index, n)
 
-        shape = (self.geometry.cell_count(), NODES_PER_ELEMENT)
+        shape = (NODES_PER_ELEMENT, self.geometry.cell_count())
         if out is None:
             element_node_indices = wp.empty(
                 shape=shape,
-                dtype=int,
+                dtype=wp.int32,
+                device=device,
             )
         else:
             if out.shape != shape or out.dtype != wp.int32:
@@ -95,24 +126,103 @@ class SpaceTopology:
             element_node_indices = out
 
         wp.launch(
-            dim=element_node_indices.shape[0],
+            dim=(NODES_PER_ELEMENT, element_node_indices.shape[1]),
             kernel=fill_element_node_indices,
             inputs=[
-                self.geometry.cell_arg_value(device=element_node_indices.device),
-                self.topo_arg_value(device=element_node_indices.device),
+                self.geometry.cell_arg_value(device=device),
+                self.topo_arg_value(device=device),
                 element_node_indices,
             ],
-            device=element_node_indices.device,
+            device=device,
         )
 
+        if out is None:
+            self._element_node_indices_cache[device.ordinal] = element_node_indices
+
         return element_node_indices
 
+    def gather_node_values(self, node_values: wp.array, out: Optional[wp.array] = None) -> wp.array:
+        """Gathers the values of each element's nodes from an array of per-node values.
+
+        The node index lookup is inlined into the gather kernel, so no intermediate
+        ``(NODES_PER_ELEMENT, element_count)`` index table is written to or read from
+        global memory.
+
+        The result uses the same node-major layout as :meth:`element_node_indices`,
+        i.e. ``out[n, e]`` holds the value at the ``n``-th node of element ``e``.
+
+        Args:
+            node_values: array of values indexed by global node index
+            out: if provided, destination array with shape ``(NODES_PER_ELEMENT, element_count)``
+              and same data type and device as `node_values`
+        """
+
+        NODES_PER_ELEMENT = self.NODES_PER_ELEMENT
+        value_type = node_values.dtype
+        device = node_values.device
+
+        gather_suffix = f"{getattr(self.element_node_index, 'key', self.name)}_{wp.types.get_type_code(value_type)}"
+
+        @cache.dynamic_kernel(suffix=gather_suffix, kernel_options={"max_unroll": NODES_PER_ELEMENT, "fast_math": True})
+        def gather_element_node_values(
+            geo_elt_arg: self.ElementArg,
+            topo_arg: self.TopologyArg,
+            node_values: wp.array(dtype=value_type),
+            element_node_values: wp.array2d(dtype=value_type),
+        ):
+            n, element_index = wp.tid()
+            element_node_values[n, element_index] = node_values[
+                self.element_node_index(geo_elt_arg, topo_arg, element_index, n)
+            ]
+
+        shape = (NODES_PER_ELEMENT, self._element_count())
+        if out is None:
+            element_node_values = wp.empty(
+                shape=shape,
+                dtype=value_type,
+                device=device,
+            )
+        else:
+            if out.shape != shape or out.dtype != value_type or out.device != device:
+                raise ValueError(
+                    f"Out element node values array must have shape {shape} and match the data type and device of node_values"
+                )
+            element_node_values = out
+
+        wp.launch(
+            dim=shape,
+            kernel=gather_element_node_values,
+            inputs=[
+                self._element_arg_value(device=device),
+                self.topo_arg_value(device=device),
+                node_values,
+                element_node_values,
+            ],
+            device=device,
+        )
+
+        return element_node_values
+
+    def _element_count(self) -> int:
+        """Number of elements this topology's node indexing is defined over"""
+        return self.geometry.cell_count()
+
+    def _element_arg_value(self, device):
+        """Value of the geometry element argument matching :attr:`ElementArg`"""
+        return self.geometry.cell_arg_value(device=device)
+
     # Interface generating trace space topology
 
     def trace(self) -> "TraceSpaceTopology":
-        """Trace of the function space over lower-dimensional elements of the geometry"""
+        """Trace of the function space over lower-dimensional elements of the geometry.
+
+        The trace topology is created on first access and reused afterwards, so that its
+        precomputed side node indices are shared by all consumers.
+        """
 
-        return TraceSpaceTopology(self)
+        if self._trace_topology is None:
+            self._trace_topology = TraceSpaceTopology(self)
+        return self._trace_topology
 
     @property
     def is_trace(self) -> bool:
@@ -123,9 +233,23 @@ class SpaceTopology:
         """Returns the full space topology from which this topology is derived"""
         return self
 
+    def _topology_key(self) -> str:
+        # Building the name string on each comparison is costly when equality is checked
+        # repeatedly during kernel generation; cache it on first use
+        if self._name_cache is None:
+            self._name_cache = self.name
+        return self._name_cache
+
     def __eq__(self, other: "SpaceTopology") -> bool:
         """Checks whether two topologies are compatible"""
-        return self.geometry == other.geometry and self.name == other.name
+        if self is other:
+            return True
+        return self.geometry == other.geometry and self._topology_key() == other._topology_key()
+
+    def __hash__(self) -> int:
+        if self._hash_cache is None:
+            self._hash_cache = hash((self.geometry, self._topology_key()))
+        return self._hash_cache
 
     def is_derived_from(self, other: "SpaceTopology") -> bool:
         """Checks whether two topologies are equal, or `self` is the trace of `other`"""
@@ -146,14 +270,17 @@ class TraceSpaceTopology(SpaceTopology):
         self.dimension = topo.dimension - 1
         self.ElementArg = topo.geometry.SideArg
 
-        self.TopologyArg = topo.TopologyArg
-        self.topo_arg_value = topo.topo_arg_value
+        self.TopologyArg = self._make_topo_arg()
 
         self.inner_cell_index = self._make_inner_cell_index()
         self.outer_cell_index = self._make_outer_cell_index()
         self.neighbor_cell_index = self._make_neighbor_cell_index()
 
+        self.element_node_index_from_cell_arg = self._make_element_node_index_from_cell_arg()
+        self._dynamic_element_node_index = self._make_dynamic_element_node_index()
         self.element_node_index = self._make_element_node_index()
+        self.inner_element_node_index = self._make_side_node_index(inner=True)
+        self.outer_element_node_index = self._make_side_node_index(inner=False)
 
     def node_count(self) -> int:
         return self._topo.node_count()
@@ -162,12 +289,74 @@ class TraceSpaceTopology(SpaceTopology):
     def name(self):
         return f"{self._topo.name}_Trace"
 
+    def _make_topo_arg(self):
+        @cache.dynamic_struct(suffix=self.name)
+        class TraceTopologyArg:
+            side_node_indices: wp.array2d(dtype=wp.int32)
+
+        return TraceTopologyArg
+
+    @cache.cached_arg_value
+    def topo_arg_value(self, device) -> "SpaceTopology.TopologyArg":
+        arg = self.TopologyArg()
+        arg.side_node_indices = self.element_node_indices(device=device)
+        return arg
+
+    def _make_warmup_kernel(self):
+        @cache.dynamic_kernel(suffix=self.name)
+        def trace_topology_warmup(
+            geo_side_arg: self.geometry.SideArg,
+            topo_arg: self.TopologyArg,
+            cell_topo_arg: self._topo.TopologyArg,
+            result: wp.array(dtype=wp.int32),
+        ):
+            side_index = wp.tid()
+            inner_cell, index_in_inner = self.inner_cell_index(geo_side_arg, side_index, 0)
+            outer_cell, index_in_outer = self.outer_cell_index(geo_side_arg, side_index, 0)
+            neighbor_cell, index_in_neighbor = self.neighbor_cell_index(geo_side_arg, side_index, 0)
+            node_index = self.element_node_index(geo_side_arg, topo_arg, side_index, 0)
+            dynamic_node_index = self._dynamic_element_node_index(geo_side_arg, cell_topo_arg, side_index, 0)
+            result[side_index] = (
+                inner_cell
+                + index_in_inner
+                + outer_cell
+                + index_in_outer
+                + neighbor_cell
+                + index_in_neighbor
+                + node_index
+                + dynamic_node_index
+            )
+
+        return trace_topology_warmup
+
+    def preload(self, device=None):
+        """Eagerly compiles the dynamically-generated functions of this topology.
+
+        By default compilation happens lazily upon the first kernel launch referencing
+        those functions; calling this method moves that one-time cost off the critical
+        path, e.g. ahead of CUDA graph capture.
+
+        Args:
+            device: device to load the compiled module on; if ``None``, all devices.
+        """
+
+        wp.load_module(self._make_warmup_kernel().module, device=device)
+
+    @property
+    def _cell_routing_suffix(self) -> str:
+        # The side-to-cell routing functions depend only on the geometry and the cell
+        # node count, so key them accordingly: all topologies sharing a geometry then
+        # reuse the same generated functions instead of JIT-ing per-topology copies
+        return f"{self.geometry.name}_{self._topo.NODES_PER_ELEMENT}"
+
     def _make_inner_cell_index(self):
         NODES_PER_ELEMENT = self._topo.NODES_PER_ELEMENT
 
-        @cache.dynamic_func(suffix=self.name)
+        @cache.dynamic_func(suffix=self._cell_routing_suffix)
         def inner_cell_index(args: self.geometry.SideArg, element_index: ElementIndex, node_index_in_elt: int):
-            index_in_inner_cell = wp.select(node_index_in_elt < NODES_PER_ELEMENT, -1, node_index_in_elt)
+            # Branchless equivalent of `n if n < NODES_PER_ELEMENT else -1`;
+            # the quotient is 0 for inner nodes and 1 for outer ones
+            index_in_inner_cell = node_index_in_elt - node_index_in_elt // NODES_PER_ELEMENT * (node_index_in_elt + 1)
             return self.geometry.side_inner_cell_index(args, element_index), index_in_inner_cell
 
         return inner_cell_index
@@ -175,7 +364,7 @@ class TraceSpaceTopology(SpaceTopology):
     def _make_outer_cell_index(self):
         NODES_PER_ELEMENT = self._topo.NODES_PER_ELEMENT
 
-        @cache.dynamic_func(suffix=self.name)
+        @cache.dynamic_func(suffix=self._cell_routing_suffix)
         def outer_cell_index(args: self.geometry.SideArg, element_index: ElementIndex, node_index_in_elt: int):
             return self.geometry.side_outer_cell_index(args, element_index), node_index_in_elt - NODES_PER_ELEMENT
 
@@ -184,39 +373,156 @@ class TraceSpaceTopology(SpaceTopology):
     def _make_neighbor_cell_index(self):
         NODES_PER_ELEMENT = self._topo.NODES_PER_ELEMENT
 
-        @cache.dynamic_func(suffix=self.name)
+        @cache.dynamic_func(suffix=self._cell_routing_suffix)
         def neighbor_cell_index(args: self.geometry.SideArg, element_index: ElementIndex, node_index_in_elt: int):
-            if node_index_in_elt < NODES_PER_ELEMENT:
-                return self.geometry.side_inner_cell_index(args, element_index), node_index_in_elt
-            else:
-                return (
-                    self.geometry.side_outer_cell_index(args, element_index),
-                    node_index_in_elt - NODES_PER_ELEMENT,
-                )
+            # Evaluate both sides unconditionally -- cheap table lookups -- so that
+            # inner and outer node halves do not diverge within a warp
+            is_inner = node_index_in_elt < NODES_PER_ELEMENT
+            inner_cell = self.geometry.side_inner_cell_index(args, element_index)
+            outer_cell = self.geometry.side_outer_cell_index(args, element_index)
+            cell_index = wp.select(is_inner, outer_cell, inner_cell)
+            index_in_cell = wp.select(is_inner, node_index_in_elt - NODES_PER_ELEMENT, node_index_in_elt)
+            return cell_index, index_in_cell
 
         return neighbor_cell_index
 
-    def _make_element_node_index(self):
+    def _make_element_node_index_from_cell_arg(self):
         @cache.dynamic_func(suffix=self.name)
-        def trace_element_node_index(
+        def trace_element_node_index_from_cell_arg(
+            geo_cell_arg: self.geometry.CellArg,
             geo_side_arg: self.geometry.SideArg,
             topo_arg: self._topo.TopologyArg,
             element_index: ElementIndex,
             node_index_in_elt: int,
         ):
             cell_index, index_in_cell = self.neighbor_cell_index(geo_side_arg, element_index, node_index_in_elt)
+            return self._topo.element_node_index(geo_cell_arg, topo_arg, cell_index, index_in_cell)
 
+        return trace_element_node_index_from_cell_arg
+
+    def _make_dynamic_element_node_index(self):
+        @cache.dynamic_func(suffix=self.name)
+        def dynamic_trace_element_node_index(
+            geo_side_arg: self.geometry.SideArg,
+            topo_arg: self._topo.TopologyArg,
+            element_index: ElementIndex,
+            node_index_in_elt: int,
+        ):
             geo_cell_arg = self.geometry.side_to_cell_arg(geo_side_arg)
-            return self._topo.element_node_index(geo_cell_arg, topo_arg, cell_index, index_in_cell)
+            return self.element_node_index_from_cell_arg(
+                geo_cell_arg, geo_side_arg, topo_arg, element_index, node_index_in_elt
+            )
+
+        return dynamic_trace_element_node_index
+
+    def _make_element_node_index(self):
+        @cache.dynamic_func(suffix=self.name)
+        def trace_element_node_index(
+            geo_side_arg: self.geometry.SideArg,
+            topo_arg: self.TopologyArg,
+            element_index: ElementIndex,
+            node_index_in_elt: int,
+        ):
+            return topo_arg.side_node_indices[node_index_in_elt, element_index]
 
         return trace_element_node_index
 
+    def _make_side_node_index(self, inner: bool):
+        """Generates a node index lookup restricted to the inner (resp. outer) cell nodes,
+        for integrals that touch a single side of the interface.
+
+        The node index argument is local to the chosen half, i.e. in ``[0, NODES_PER_ELEMENT)``
+        of the cell topology.
+        """
+
+        NODES_PER_CELL = self._topo.NODES_PER_ELEMENT
+        node_offset = 0 if inner else NODES_PER_CELL
+
+        @cache.dynamic_func(suffix=f"{self.name}_{'Inner' if inner else 'Outer'}")
+        def side_node_index(
+            geo_side_arg: self.geometry.SideArg,
+            topo_arg: self.TopologyArg,
+            element_index: ElementIndex,
+            node_index_in_elt: int,
+        ):
+            return topo_arg.side_node_indices[node_index_in_elt + node_offset, element_index]
+
+        return side_node_index
+
+    def element_node_indices(self, out: Optional[wp.array] = None, device=None) -> wp.array:
+        """Returns an array containing the global index for each node of each side.
+
+        Uses the same node-major layout and per-device caching as
+        :meth:`SpaceTopology.element_node_indices`, with shape ``(NODES_PER_ELEMENT, side_count)``.
+        """
+
+        if out is not None:
+            device = out.device
+        else:
+            device = wp.get_device(device)
+            cached = self._element_node_indices_cache.get(device.ordinal)
+            if cached is not None:
+                return cached
+
+        NODES_PER_ELEMENT = self.NODES_PER_ELEMENT
+
+        @cache.dynamic_kernel(suffix=self.name, kernel_options={"max_unroll": NODES_PER_ELEMENT, "fast_math": True})
+        def fill_side_node_indices(
+            geo_side_arg: self.geometry.SideArg,
+            topo_arg: self._topo.TopologyArg,
+            side_node_indices: wp.array2d(dtype=wp.int32),
+        ):
+            side_index = wp.tid()
+            # Convert the side argument once per side rather than once per node
+            geo_cell_arg = self.geometry.side_to_cell_arg(geo_side_arg)
+            for n in range(NODES_PER_ELEMENT):
+                side_node_indices[n, side_index] = self.element_node_index_from_cell_arg(
+                    geo_cell_arg, geo_side_arg, topo_arg, side_index, n
+                )
+
+        shape = (NODES_PER_ELEMENT, self.geometry.side_count())
+        if out is None:
+            side_node_indices = wp.empty(
+                shape=shape,
+                dtype=wp.int32,
+                device=device,
+            )
+        else:
+            if out.shape != shape or out.dtype != wp.int32:
+                raise ValueError(f"Out element node indices array must have shape {shape} and data type 'int32'")
+            side_node_indices = out
+
+        wp.launch(
+            dim=side_node_indices.shape[1],
+            kernel=fill_side_node_indices,
+            inputs=[
+                self.geometry.side_arg_value(device=device),
+                self._topo.topo_arg_value(device=device),
+                side_node_indices,
+            ],
+            device=device,
+        )
+
+        if out is None:
+            self._element_node_indices_cache[device.ordinal] = side_node_indices
+
+        return side_node_indices
+
+    def _element_count(self) -> int:
+        return self.geometry.side_count()
+
+    def _element_arg_value(self, device):
+        return self.geometry.side_arg_value(device=device)
+
     def full_space_topology(self) -> SpaceTopology:
         """Returns the full space topology from which this topology is derived"""
         return self._topo
 
     def __eq__(self, other: "TraceSpaceTopology") -> bool:
-        return self._topo == other._topo
+        return self is other or self._topo == other._topo
+
+    def __hash__(self) -> int:
+        return hash((TraceSpaceTopology, self._topo))
 
 
 class DiscontinuousSpaceTopologyMixin:
@@ -225,9 +531,14 @@ class DiscontinuousSpaceTopologyMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.element_node_index = self._make_element_node_index()
+        self._node_count = None
 
     def node_count(self):
-        return self.geometry.cell_count() * self.NODES_PER_ELEMENT
+        # Memoized, as cell_count() may walk the geometry and this is queried from
+        # hot host-side paths (dof renumbering, sparsity pattern construction)
+        if self._node_count is None:
+            self._node_count = self.geometry.cell_count() * self.NODES_PER_ELEMENT
+        return self._node_count
 
     @property
     def name(self):
@@ -295,3 +606,21 @@ def forward_base_topology(topology_class: Type[SpaceTopology], geometry: Geometr
         return DeformedGeometrySpaceTopology(geometry, base_topo)
 
     return topology_class(geometry, *args, **kwargs)
+
+
+def preload_topologies(topologies, device=None, max_workers: Optional[int] = None):
+    """Eagerly compiles the dynamically-generated functions of a batch of topologies,
+    building distinct modules concurrently.
+
+    Useful for applications instantiating several function spaces (e.g. mixed-order or
+    multi-field problems), whose modules would otherwise be compiled sequentially upon
+    first launch.
+
+    Args:
+        topologies: the topologies whose generated modules should be loaded
+        device: device to load the compiled modules on; if ``None``, all devices
+        max_workers: maximum number of compilation threads
+    """
+
+    modules = [topo._make_warmup_kernel().module for topo in topologies if isinstance(topo, TraceSpaceTopology)]
+    cache.preload_modules(modules, device=device, max_workers=max_workers)
@@ -492,6 +492,121 @@ def test_grid_2d(test, device):
     assert_np_equal(cell_measures.numpy(), np.full(cell_measures.shape, 1.0 / (N**2)), tol=1.0e-4)
 
 
+def test_trace_cell_index_lookups(test, device):
+    N = 3
+
+    geo = fem.Grid2D(res=wp.vec2i(N))
+    space = fem.make_polynomial_space(geo, degree=2)
+    trace_topo = space.topology.trace()
+
+    NODES_PER_CELL = space.topology.NODES_PER_ELEMENT
+
+    @dynamic_kernel(suffix=trace_topo.name, kernel_options={"enable_backward": False})
+    def trace_cell_index_kernel(side_arg: geo.SideArg):
+        side_index, node_index_in_elt = wp.tid()
+
+        inner_cell, index_in_inner = trace_topo.inner_cell_index(side_arg, side_index, node_index_in_elt)
+        outer_cell, index_in_outer = trace_topo.outer_cell_index(side_arg, side_index, node_index_in_elt)
+        neighbor_cell, index_in_neighbor = trace_topo.neighbor_cell_index(side_arg, side_index, node_index_in_elt)
+
+        wp.expect_eq(inner_cell, geo.side_inner_cell_index(side_arg, side_index))
+        wp.expect_eq(outer_cell, geo.side_outer_cell_index(side_arg, side_index))
+
+        # branchless lookups must agree with the straightforward branching logic
+        if node_index_in_elt < NODES_PER_CELL:
+            wp.expect_eq(index_in_inner, node_index_in_elt)
+            wp.expect_eq(neighbor_cell, inner_cell)
+            wp.expect_eq(index_in_neighbor, node_index_in_elt)
+        else:
+            wp.expect_eq(index_in_inner, -1)
+            wp.expect_eq(index_in_outer, node_index_in_elt - NODES_PER_CELL)
+            wp.expect_eq(neighbor_cell, outer_cell)
+            wp.expect_eq(index_in_neighbor, node_index_in_elt - NODES_PER_CELL)
+
+    wp.launch(
+        kernel=trace_cell_index_kernel,
+        dim=(geo.side_count(), trace_topo.NODES_PER_ELEMENT),
+        inputs=[geo.side_arg_value(device)],
+        device=device,
+    )
+
+
+def test_gather_node_values(test, device):
+    N = 3
+
+    geo = fem.Grid2D(res=wp.vec2i(N))
+    space = fem.make_polynomial_space(geo, degree=2)
+    trace_topo = space.topology.trace()
+
+    node_values = wp.array(np.linspace(1.0, 2.0, space.topology.node_count()), dtype=float, device=device)
+
+    for topo in (space.topology, trace_topo):
+        node_indices = topo.element_node_indices(device=device).numpy()
+
+        # fused gather must agree with an explicit gather through the node index table
+        gathered = topo.gather_node_values(node_values)
+        assert_np_equal(gathered.numpy(), node_values.numpy()[node_indices])
+
+        out = wp.empty(shape=gathered.shape, dtype=float, device=device)
+        topo.gather_node_values(node_values, out=out)
+        assert_np_equal(out.numpy(), node_values.numpy()[node_indices])
+
+        with test.assertRaises(ValueError):
+            topo.gather_node_values(node_values, out=wp.empty(shape=(1, 1), dtype=float, device=device))
+
+    # one-sided lookups must agree with the matching halves of the full node range
+    NODES_PER_CELL = space.topology.NODES_PER_ELEMENT
+
+    @dynamic_kernel(suffix=trace_topo.name, kernel_options={"enable_backward": False})
+    def one_sided_node_index_kernel(side_arg: geo.SideArg, topo_arg: trace_topo.TopologyArg):
+        side_index, node_index_in_cell = wp.tid()
+
+        inner_node = trace_topo.inner_element_node_index(side_arg, topo_arg, side_index, node_index_in_cell)
+        outer_node = trace_topo.outer_element_node_index(side_arg, topo_arg, side_index, node_index_in_cell)
+
+        wp.expect_eq(inner_node, trace_topo.element_node_index(side_arg, topo_arg, side_index, node_index_in_cell))
+        wp.expect_eq(
+            outer_node,
+            trace_topo.element_node_index(side_arg, topo_arg, side_index, node_index_in_cell + NODES_PER_CELL),
+        )
+
+    wp.launch(
+        kernel=one_sided_node_index_kernel,
+        dim=(geo.side_count(), NODES_PER_CELL),
+        inputs=[geo.side_arg_value(device), trace_topo.topo_arg_value(device)],
+        device=device,
+    )
+
+
+def test_empty_topology_arg(test, device):
+    # Regression check for empty argument structs: SpaceTopology.TopologyArg carries no
+    # field, and must still marshal correctly through the kernel launch ABI
+    N = 3
+
+    geo = fem.Grid2D(res=wp.vec2i(N))
+    space = fem.make_polynomial_space(geo, degree=0)
+    topo = space.topology
+
+    @dynamic_kernel(suffix=topo.name, kernel_options={"enable_backward": False})
+    def empty_topo_arg_kernel(
+        cell_arg: geo.CellArg,
+        topo_arg: topo.TopologyArg,
+        node_indices: wp.array(dtype=int),
+    ):
+        cell_index = wp.tid()
+        node_indices[cell_index] = topo.element_node_index(cell_arg, topo_arg, cell_index, 0)
+
+    node_indices = wp.empty(shape=geo.cell_count(), dtype=int, device=device)
+    wp.launch(
+        kernel=empty_topo_arg_kernel,
+        dim=geo.cell_count(),
+        inputs=[geo.cell_arg_value(device), topo.topo_arg_value(device), node_indices],
+        device=device,
+    )
+
+    assert_np_equal(node_indices.numpy(), np.arange(geo.cell_count()))
+
+
 def test_triangle_mesh(test, device):
     N = 3
 
@@ -1248,6 +1363,9 @@ add_function_test(TestFem, "test_interpolate_gradient", test_interpolate_gradien
 add_function_test(TestFem, "test_vector_divergence_theorem", test_vector_divergence_theorem, devices=devices)
 add_function_test(TestFem, "test_tensor_divergence_theorem", test_tensor_divergence_theorem, devices=devices)
 add_function_test(TestFem, "test_grid_2d", test_grid_2d, devices=devices)
+add_function_test(TestFem, "test_trace_cell_index_lookups", test_trace_cell_index_lookups, devices=devices)
+add_function_test(TestFem, "test_gather_node_values", test_gather_node_values, devices=devices)
+add_function_test(TestFem, "test_empty_topology_arg", test_empty_topology_arg, devices=devices)
 add_function_test(TestFem, "test_triangle_mesh", test_triangle_mesh, devices=devices)
 add_function_test(TestFem, "test_quad_mesh", test_quad_mesh, devices=devices)
 add_function_test(TestFem, "test_grid_3d", test_grid_3d, devices=devices)